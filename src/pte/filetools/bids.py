@@ -7,7 +7,6 @@ from pathlib import Path
 import mne
 import mne_bids
 import mne_bids.copyfiles
-import numpy as np
 import pandas as pd
 import pybv
 from mne_bids.path import get_bids_path_from_fname
@@ -58,10 +57,12 @@ def add_coord_column(
         new_ch = pte.preprocessing.channels.summation_channel_name(ch_names)
     elif new_ch == "auto_bipolar":
         new_ch = pte.preprocessing.channels.bipolar_channel_name(ch_names)
-    coords = [
-        df_chs.loc[ch_name][["x", "y", "z"]].values for ch_name in ch_names
-    ]
-    coords = np.array(coords, float).mean(axis=0).round(5)
+    coords = (
+        df_chs.loc[list(ch_names), ["x", "y", "z"]]
+        .to_numpy(dtype=float)
+        .mean(axis=0)
+        .round(5)
+    )
     df_chs.loc[new_ch] = df_chs.loc[ch_names[0]]
     df_chs.loc[new_ch, "size"] = None
     df_chs.loc[new_ch, ["x", "y", "z"]] = coords
@@ -335,9 +336,12 @@ def _rewrite_channels(
     channels_old = data_old.index.tolist()
     channels_new = raw.ch_names
 
-    channels_to_remove = [ch for ch in channels_old if ch not in raw.ch_names]
+    old_set = set(channels_old)
+    new_set = set(channels_new)
+
+    channels_to_remove = [ch for ch in channels_old if ch not in new_set]
 
-    channels_to_add = [ch for ch in channels_new if ch not in channels_old]
+    channels_to_add = [ch for ch in channels_new if ch not in old_set]
 
     if not any((channels_to_add, channels_to_remove)):
         return
@@ -348,11 +352,9 @@ def _rewrite_channels(
     if channels_to_add:
         add_list = []
         ch_types = raw.get_channel_types(picks=channels_to_add)
+        template_row = data_old.iloc[0].to_dict()
         for ch_name, ch_type in zip(channels_to_add, ch_types):
-            add_dict = {
-                data_old.columns[i]: data_old.iloc[0][i]
-                for i in range(len(data_old.columns))
-            }
+            add_dict = template_row.copy()
             add_dict.update(
                 status="good",
                 description=_get_description(ch_type),
@@ -382,7 +384,7 @@ def _rewrite_electrodes(file: str | Path, raw: mne.io.BaseRaw) -> None:
     data_old: pd.DataFrame = pd.read_csv(  # type: ignore
         file, sep="\t", index_col=0
     )
-    electrodes_old = data_old.index.tolist()
+    electrodes_old = set(data_old.index)
 
     electrodes_to_add = []
     for ch_name, ch_type in zip(raw.ch_names, raw.get_channel_types()):
@@ -1,9 +1,9 @@
 """Find and filter files. Supports BIDSPath objects from `mne-bids`."""
 
+import functools
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
 import mne_bids
 
@@ -41,15 +41,7 @@ class DefaultFinder(FileFinder):
     """Class for finding and handling any type of file."""
 
     def __iter__(self):
-        self._n = 0
-        return self
-
-    def __next__(self) -> Any:
-        if self._n == len(self.files):
-            raise StopIteration
-        file = self.files[self._n]
-        self._n += 1
-        return file
+        return iter(self.files)
 
     def find_files(
         self,
@@ -175,11 +167,8 @@ class BIDSFinder(FileFinder):
         """Create list of mne-bids BIDSPath objects from list of filepaths."""
         bids_paths = []
         for filepath in filepaths:
-            # entities = mne_bids.get_entities_from_fname(filepath)
             try:
-                bids_path = mne_bids.get_bids_path_from_fname(
-                    fname=filepath, verbose=False
-                )
+                bids_path = _bids_path_from_fname(filepath).copy()
                 bids_path.update(root=self.directory)
             except ValueError as err:
                 print(
@@ -191,6 +180,15 @@ class BIDSFinder(FileFinder):
         return bids_paths
 
 
+@functools.lru_cache(maxsize=None)
+def _bids_path_from_fname(filepath: str) -> mne_bids.BIDSPath:
+    """Parse BIDSPath from filename, caching repeated parses.
+
+    Callers must copy the returned object before mutating it.
+    """
+    return mne_bids.get_bids_path_from_fname(fname=filepath, verbose=False)
+
+
 class FinderNotFoundError(Exception):
     """Exception raised when invalid Finder is passed.
 
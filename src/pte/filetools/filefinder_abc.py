@@ -1,9 +1,11 @@
 """Define abstract base classes to construct FileFinder classes."""
 
+import functools
 import os
+import re
 import shutil
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -74,16 +76,16 @@ class FileFinder(ABC):
 
     @staticmethod
     def _keyword_search(
-        files: list[str], keywords: str | Sequence[str] | None
+        files: Iterable[str], keywords: str | Sequence[str] | None
     ) -> list:
         if not keywords:
-            return files
+            return list(files)
         if isinstance(keywords, str):
             keywords = [keywords]
-        filtered_files = [
-            file for file in files if any(key in file for key in keywords)
-        ]
-        return filtered_files
+        # A single compiled alternation scans each path once instead of
+        # one Python-level substring test per keyword.
+        pattern = re.compile("|".join(map(re.escape, keywords)))
+        return [file for file in files if pattern.search(file)]
 
     def _find_files(
         self,
@@ -99,13 +101,10 @@ class FileFinder(ABC):
             verbose (bool): verbosity level (optional, default=True)
         """
 
-        files = []
-        for root, _, fnames in os.walk(directory):
-            fnames = [os.path.join(root, file) for file in fnames]
-            fnames = self._keyword_search(fnames, extensions)
-            if fnames:
-                files.extend(fnames)
-        self.files = files
+        all_files = (
+            str(path) for path in Path(directory).rglob("*") if path.is_file()
+        )
+        self.files = self._keyword_search(all_files, extensions)
 
     def _filter_files(
         self,
@@ -146,9 +145,11 @@ class FileFinder(ABC):
                 raise ValueError("Keyword for medication not valid.")
             filtered_files = self._keyword_search(filtered_files, [med])
         if hemisphere is not None:
+            pick_ipsilateral = hemisphere.lower() in "ipsilateral"
+            pick_contralateral = hemisphere.lower() in "contralateral"
             matching_files = []
             for file in filtered_files:
-                subject = mne_bids.get_entities_from_fname(file)["subject"]
+                subject = _entities_from_fname(file)["subject"]
                 if (
                     subject not in self.hemispheres
                     or self.hemispheres[subject] is None
@@ -157,14 +158,20 @@ class FileFinder(ABC):
                         subject, self.hemispheres
                     )
                 hem = self.hemispheres[subject] + "_"
-                if hemisphere.lower() in "ipsilateral" and hem in file:
+                if pick_ipsilateral and hem in file:
                     matching_files.append(file)
-                if hemisphere.lower() in "contralateral" and hem not in file:
+                if pick_contralateral and hem not in file:
                     matching_files.append(file)
             filtered_files = matching_files
         self.files = filtered_files
 
 
+@functools.lru_cache(maxsize=None)
+def _entities_from_fname(fname: str) -> dict:
+    """Parse BIDS entities from filename, caching repeated lookups."""
+    return mne_bids.get_entities_from_fname(fname)
+
+
 class DirectoryNotFoundError(Exception):
     """Exception raised when invalid Reader is passed.
 
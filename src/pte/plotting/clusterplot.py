@@ -18,6 +18,7 @@ def clusterplot_combined(
     outpath: Path | str | None = None,
     show: bool = True,
     n_jobs: int = 1,
+    dpi: int | str = "figure",
 ) -> matplotlib.figure.Figure:
     """Plot power, p-values and significant clusters."""
 
@@ -82,7 +83,6 @@ def clusterplot_combined(
     if cluster_arr:
         for cluster in cluster_arr:
             squared[cluster] = 1
-    np.expand_dims(squared, axis=0)
 
     pos_2 = axs[2].imshow(
         squared,
@@ -95,7 +95,7 @@ def clusterplot_combined(
     fig.suptitle(title)
     fig.tight_layout()
     if outpath:
-        fig.savefig(outpath)
+        fig.savefig(outpath, dpi=dpi)
     if show:
         plt.show()
     return fig
@@ -118,8 +118,9 @@ def mni2coor(
     matrix_transp = np.transpose(np.linalg.inv(matrix))
     coords = vector.dot(matrix_transp)[:, 0:3]
 
-    vround = np.vectorize(matlab_round)
-    return vround(coords)
+    # Round half away from zero like MATLAB's round, without calling
+    # back into Python for every single coordinate.
+    return np.trunc(coords + np.copysign(0.5, coords)).astype(int)
 
 
 def matlab_round(value: int | float) -> int:
@@ -155,9 +155,9 @@ def _plot_single_hem(
 
     pos_list = []
     for i, ch_type in enumerate(("ECOG", "LFP")):
-        ind = data["name"].str.contains(ch_type)
-        coord = data.loc[ind, ["x", "y"]].to_numpy(dtype=np.float32)
-        values = data.loc[ind, key].to_numpy(dtype=np.float32)
+        data_picks = data.loc[data["name"].str.contains(ch_type)]
+        coord = data_picks[["x", "y"]].to_numpy(dtype=np.float32)
+        values = data_picks[key].to_numpy(dtype=np.float32)
         lims_list = list(lims[i])
         for idx, lim in enumerate(lims_list):
             if lim:
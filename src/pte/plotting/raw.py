@@ -5,7 +5,6 @@ from typing import Optional, Union
 
 import mne
 import numpy as np
-import pandas as pd
 import scipy.signal
 
 
@@ -100,7 +99,7 @@ def plotly_rawdata(
             y-axis. For highly variant data, use higher values. default is 2.
     """
     try:
-        from plotly import express
+        from plotly import graph_objects
     except ImportError as e:
         print(
             "For full plotting functionality, please install the `plotly`"
@@ -120,46 +119,63 @@ def plotly_rawdata(
         signals_array.shape[1] == time_array.shape[0]
     ), "signals_array ! time_array Dimension mismatch!"
 
+    # Single precision is plenty for visualization and halves the bytes
+    # moved by every subsequent pass over the signals. Always copy so
+    # the in-place passes below never write into the caller's array.
+    signals_array = signals_array.astype(np.float32)
+
     if decimate:
         decimate_factor = min(10, int(sfreq / 200))
-        signals_array = scipy.signal.decimate(signals_array, decimate_factor)
-        time_array = scipy.signal.decimate(time_array, decimate_factor)
+        if decimate_factor > 1:
+            signals_array = scipy.signal.decimate(
+                signals_array, decimate_factor
+            )
+            # Time stamps are monotonic; a plain stride yields the same
+            # samples as decimating without an anti-aliasing filter pass.
+            time_array = time_array[::decimate_factor]
     if detrend in ("linear", "constant"):
         signals_array = scipy.signal.detrend(
             signals_array, axis=1, type=detrend, overwrite_data=True
         )
     if normalize:
-        eps_ = np.finfo(float).eps
-        signals_array = signals_array / (
-            _rms(signals_array, axis=1).reshape(-1, 1) + eps_
-        )
+        eps_ = np.finfo(signals_array.dtype).eps
+        signals_array /= _rms(signals_array, axis=1).reshape(-1, 1) + eps_
 
     offset_value = padding * _rms(signals_array)  # RMS value
-    signals_array = signals_array + offset_value * (
-        np.arange(len(channels_array)).reshape(-1, 1)
-    )
-
-    signals_df = pd.DataFrame(
-        data=signals_array.T, index=time_array, columns=channels_array
+    signals_array += offset_value * np.arange(len(channels_array)).reshape(
+        -1, 1
     )
 
-    fig = express.line(
-        signals_df,
-        x=signals_df.index,
-        y=signals_df.columns,
-        line_shape="spline",
-        render_mode="svg",
-        labels=dict(index="Time (s)", value="(a.u.)", variable="Channel"),
-        title=plot_title,
-    )
+    # Hand the channel rows to plotly as NumPy views instead of copying
+    # them into a transposed DataFrame first.
+    fig = graph_objects.Figure()
+    for ch_name, signal in zip(channels_array, signals_array):
+        fig.add_trace(
+            graph_objects.Scattergl(
+                x=time_array, y=signal, mode="lines", name=str(ch_name)
+            )
+        )
     fig.update_layout(
+        title=plot_title,
+        xaxis_title="Time (s)",
+        legend_title_text="Channel",
         yaxis=dict(
+            title="(a.u.)",
             tickmode="array",
             tickvals=offset_value * np.arange(len(channels_array)),
             ticktext=channels_array,
-        )
+        ),
     )
 
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        pass
+    else:
+        # Optionally aggregate each trace to ~1000 shown samples so the
+        # exported HTML does not embed every single data point.
+        fig = FigureResampler(fig, default_n_shown_samples=1000)
+
     fig.write_html(str(file_name) + ".html")
 
 
@@ -170,6 +186,10 @@ def _rms(data: np.ndarray, axis: int = -1) -> np.ndarray:
     if axis >= data.ndim:
         raise ValueError(f"No {axis=} for data with {data.ndim} dimensions!")
 
+    # einsum fuses square and sum into one pass, avoiding the full-size
+    # squared intermediate that np.square would allocate.
     if axis < 0:
-        return np.sqrt(np.mean(np.square(data)))
-    return np.sqrt(np.mean(np.square(data), axis=axis))
+        flat = data.ravel()
+        return np.sqrt(np.einsum("i,i->", flat, flat) / flat.size)
+    moved = np.moveaxis(data, axis, -1)
+    return np.sqrt(np.einsum("...i,...i->...", moved, moved) / moved.shape[-1])
@@ -5,7 +5,7 @@ from typing import Optional, Union
 
 import mne
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 
 def get_emg_rms(
@@ -77,10 +77,11 @@ def get_emg_rms(
     data_rms = np.empty((len(window_duration), len(data)))
 
     for idx, window in enumerate(window_duration):
-        rms_raw = _rms_window_nb(data, window, raw.info["sfreq"])
-        rms_zscore = (rms_raw - np.mean(rms_raw)) / np.std(rms_raw)
-        # now scale for compatibility with other MISC channels
-        data_rms[idx, :] = rms_zscore
+        data_rms[idx, :] = _rms_window_nb(data, window, raw.info["sfreq"])
+    # z-score all windows at once to scale for compatibility with other
+    # MISC channels
+    data_rms -= data_rms.mean(axis=1, keepdims=True)
+    data_rms /= data_rms.std(axis=1, keepdims=True)
 
     emg_ch_names = [f"EMG_RMS_{window}" for window in window_duration]
 
@@ -88,12 +89,14 @@ def get_emg_rms(
         if isinstance(analog_ch, str):
             analog_ch = [analog_ch]
         data_analog = raw.copy().pick(picks=analog_ch).get_data()[0]
-        if np.abs(min(data_analog)) > max(data_analog):
-            data_analog = data_analog * -1
-        data_all = np.vstack((data_analog, data_bip, data_rms))
+        if np.abs(data_analog.min()) > data_analog.max():
+            np.negative(data_analog, out=data_analog)
+        data_all = np.concatenate(
+            (data_analog[np.newaxis, :], data_bip[np.newaxis, :], data_rms)
+        )
         ch_names = analog_ch + ["EMG_BIP"] + emg_ch_names
     else:
-        data_all = np.vstack((data_bip, data_rms))
+        data_all = np.concatenate((data_bip[np.newaxis, :], data_rms))
         ch_names = ["EMG_BIP"] + emg_ch_names
 
     # Create new raw object
@@ -110,7 +113,7 @@ def get_emg_rms(
     return raw_rms
 
 
-@njit
+@njit(cache=True, parallel=True)
 def _rms_window_nb(
     data: np.ndarray, window_len: float | int, sfreq: float | int
 ) -> np.ndarray:
@@ -133,9 +136,10 @@ def _rms_window_nb(
 
     half_window_size = int(sfreq * window_len / 1000 / 2)
     data_rms = np.empty_like(data)
-    for i, dat_ in enumerate(data):
-        if i in (0, len(data) - 1):
-            data_rms[i] = np.absolute(dat_)
+    # Windows are independent, so samples are processed in parallel.
+    for i in prange(len(data)):  # pylint: disable=not-an-iterable
+        if i == 0 or i == len(data) - 1:
+            data_rms[i] = np.absolute(data[i])
         elif i < half_window_size:
             new_window_size = i
             data_rms[i] = np.sqrt(
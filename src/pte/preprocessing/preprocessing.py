@@ -18,7 +18,12 @@ def pick_by_nm_channels(
     raw = raw.copy()
     basename = str(Path(fname).stem)
     fpath = Path(nm_channels_dir) / Path(basename + "_nm_channels.csv")
-    nm_channels: pd.DataFrame = pd.read_csv(fpath, header=0)
+    nm_channels: pd.DataFrame = pd.read_csv(
+        fpath,
+        header=0,
+        usecols=["new_name", "used"],
+        dtype={"new_name": str, "used": int},
+    )
     channel_picks = nm_channels[(nm_channels["used"] == 1)]
     if len(channel_picks) == 0:
         raise ValueError(
@@ -46,7 +51,18 @@ def bipolar_refs_from_nm_channels(
     else:
         basename = str(Path(filename).stem)
     fpath = Path(nm_channels_dir) / Path(basename + "_nm_channels.csv")
-    nm_channels: pd.DataFrame = pd.read_csv(fpath, header=0)
+    nm_channels: pd.DataFrame = pd.read_csv(
+        fpath,
+        header=0,
+        usecols=["name", "new_name", "rereference", "type", "used"],
+        dtype={
+            "name": str,
+            "new_name": str,
+            "rereference": str,
+            "type": str,
+            "used": int,
+        },
+    )
     anodes, cathodes, ch_names = [], [], []
     for ch_type in types:
         df_picks = nm_channels.loc[
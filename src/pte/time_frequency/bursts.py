@@ -33,32 +33,18 @@ def burst_length_and_amplitude(
         Burst length (in seconds), mean burst amplitude and start and end
         indexes of individual bursts
     """
-    bursts = np.zeros(power.shape[0] + 1)
-    bursts[1:] = power >= threshold
-    bursts_onoff = np.diff(bursts)
-    isburst = False
-    burst_length = []
-    burst_start = 0
-    burst_amplitude = []
-    burst_indexes = []
-    for index, threshold_crossed in enumerate(bursts_onoff):
-        if threshold_crossed:
-            if isburst:
-                burst_length.append(index - burst_start)
-                burst_amplitude.append(power[burst_start:index].mean())
-                burst_indexes.append([burst_start, index])
-                isburst = False
-            else:
-                burst_start = index
-                isburst = True
-    if isburst:
-        burst_length.append(index + 1 - burst_start)
-        burst_amplitude.append(power[burst_start : index + 1].mean())
-        burst_indexes.append([burst_start, index + 1])
-    burst_length = np.array(burst_length) / sfreq
+    bursts = (power >= threshold).view(np.int8)
+    bursts_onoff = np.diff(bursts, prepend=np.int8(0), append=np.int8(0))
+    burst_starts = np.flatnonzero(bursts_onoff == 1)
+    burst_ends = np.flatnonzero(bursts_onoff == -1)
+    burst_length = (burst_ends - burst_starts) / sfreq
     returns = [burst_length]
     if return_burst_amplitude:
-        returns.append(np.array(burst_amplitude))
+        power_cumsum = np.concatenate(([0.0], np.cumsum(power)))
+        burst_amplitude = (
+            power_cumsum[burst_ends] - power_cumsum[burst_starts]
+        ) / (burst_ends - burst_starts)
+        returns.append(burst_amplitude)
     if return_burst_indexes:
-        returns.append(np.array(burst_indexes))
+        returns.append(np.column_stack((burst_starts, burst_ends)))
     return tuple(returns)
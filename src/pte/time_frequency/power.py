@@ -1,6 +1,7 @@
 """Functions for calculating and handling band-power."""
 from pathlib import Path
 
+import joblib
 import matplotlib.figure
 import mne
 import mne_bids
@@ -16,6 +17,7 @@ def plot_power(
     title: str | None = None,
     fname: str | Path | None = None,
     show: bool = True,
+    dpi: int = 300,
     **kwargs_plot,
 ) -> matplotlib.figure.Figure:
     """Plot single MNE AverageTFR object."""
@@ -39,7 +41,7 @@ def plot_power(
     if fname:
         fig.savefig(
             fname=fname,
-            dpi=300,
+            dpi=dpi,
             bbox_inches="tight",
         )
     return fig
@@ -48,10 +50,23 @@ def plot_power(
 def smooth_power(
     power: mne.time_frequency.AverageTFR,
     smoothing_type: str = "gaussian",
+    n_jobs: int = 1,
     **kwargs,
 ) -> mne.time_frequency.AverageTFR:
     """Smooth data in AverageTFR object using scipy smoothing filters."""
     power = power.copy()
+    if n_jobs != 1:
+        # The scipy filters release the GIL, so threads smooth channels
+        # concurrently without copying data between processes.
+        smoothed = joblib.Parallel(n_jobs=n_jobs, prefer="threads")(
+            joblib.delayed(smooth_2d_array)(
+                data=data, smoothing_type=smoothing_type, **kwargs
+            )
+            for data in power.data
+        )
+        for i, data in enumerate(smoothed):
+            power.data[i] = data
+        return power
     for i, data in enumerate(power.data):
         power.data[i] = smooth_2d_array(
             data=data,
@@ -221,21 +236,23 @@ def _get_baseline_indices(
 
 def get_baseline(
     powers: list[mne.time_frequency.AverageTFR],
-    picks: str | list[str] | slice,
+    picks: str | list[str] | slice,  # pylint: disable=unused-argument
     baseline: tuple[int | float | None, int | float | None] = (None, None),
 ) -> list[np.ndarray]:
-    """Get baseline array of given list of AverageTFRs."""
+    """Get baseline array of given list of AverageTFRs.
+
+    The full data array of each power object is used; ``picks`` is kept
+    for backwards compatibility of the call signature only.
+    """
     if not isinstance(powers, list):
         powers = [powers]
 
     baselines = []
     for power in powers:
-        baseline_array = power.copy().pick(picks=picks)
         imin, imax = _get_baseline_indices(
             baseline=baseline, times=power.times
         )
-        baseline_array = power.data[..., imin:imax]
-        baselines.append(baseline_array)
+        baselines.append(power.data[..., imin:imax])
 
     return baselines
 
@@ -265,7 +282,9 @@ def average_power(
             )
 
     power_all = None
-    power_all_files = []
+    power_all_files = np.empty(
+        (len(powers), powers[0].freqs.size, powers[0].times.size)
+    )
     for i, power in enumerate(powers):
         power = power.copy().pick(picks=picks)
         if baseline is not None:
@@ -279,27 +298,17 @@ def average_power(
             power = apply_baseline(
                 power=power, baseline=baseline, mode=baseline_mode
             )  # type: ignore
-        df_power = power.to_data_frame(picks=picks)
-        freqs = power.freqs  # type: ignore
-        power_all_freqs = []
-        for freq in freqs:
-            power_single_freq = (
-                df_power[df_power["freq"] == freq]
-                .sort_values(by="time", axis="index")
-                .drop(columns=["freq", "time"])
-                .to_numpy()
+        # Operate on the (channels, freqs, times) array directly instead
+        # of taking a detour through a long-format DataFrame.
+        power_single_file = power.data
+        # reject artifacts by clipping
+        if clip is not None:
+            power_single_file = power_single_file.clip(
+                min=clip * -1, max=clip
             )
-            # reject artifacts by clipping
-            if clip is not None:
-                power_single_freq = power_single_freq.clip(
-                    min=clip * -1, max=clip
-                )
-            power_all_freqs.append(power_single_freq)
         # Average across all channels
-        power_all_files.append(np.stack(power_all_freqs, axis=0).mean(axis=-1))
-    power_array_all = np.expand_dims(
-        np.stack(power_all_files, axis=0).mean(axis=0), axis=0
-    )
+        power_all_files[i] = power_single_file.mean(axis=0)
+    power_array_all = np.expand_dims(power_all_files.mean(axis=0), axis=0)
     if clip is not None:
         power_array_all = power_array_all.clip(min=clip * -1, max=clip)
     power = powers[0]
@@ -319,18 +328,26 @@ def average_power(
 
 
 def load_power(
-    files: list[Path | str], verbose: bool = False
+    files: list[Path | str], verbose: bool = False, n_jobs: int = 1
 ) -> list[mne.time_frequency.AverageTFR] | list[mne.time_frequency.EpochsTFR]:
     """Load power from *-tfr.h5 files."""
-    powers = []
-    for file in files:
-        power = mne.time_frequency.read_tfrs(file)
-        if isinstance(power, list):
-            if verbose:
-                print("Only returning first object from tfr file.")
-            power = power[0]
-        powers.append(power)
-    return powers
+    if n_jobs != 1:
+        return joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_read_single_tfr)(file, verbose) for file in files
+        )
+    return [_read_single_tfr(file, verbose) for file in files]
+
+
+def _read_single_tfr(
+    file: Path | str, verbose: bool = False
+) -> mne.time_frequency.AverageTFR | mne.time_frequency.EpochsTFR:
+    """Load single *-tfr.h5 file."""
+    power = mne.time_frequency.read_tfrs(file)
+    if isinstance(power, list):
+        if verbose:
+            print("Only returning first object from tfr file.")
+        power = power[0]
+    return power
 
 
 def morlet_from_epochs(
@@ -451,7 +468,9 @@ def discard_epochs(
 ) -> mne.Epochs:
     """Discard epochs based on minimal distance between event onset and end."""
     if events_end is not None:
-        events = np.sort(np.hstack((events_begin[:, 0], events_end[:, 0])))
+        events = np.sort(
+            np.concatenate((events_begin[:, 0], events_end[:, 0]))
+        )
         event_diffs = np.diff(events)[1::2]
     else:
         events = events_begin[:, 0]
@@ -513,12 +532,8 @@ def power_from_bids(
             )
             if bad_epochs_df is not None:
                 bad_epochs = bad_epochs_df.event_id.to_numpy()
-                bad_indices = np.array(
-                    [
-                        idx
-                        for idx, event in enumerate(epochs.selection)
-                        if event in bad_epochs
-                    ]
+                bad_indices = np.flatnonzero(
+                    np.isin(epochs.selection, bad_epochs)
                 )
                 epochs = epochs.drop(indices=bad_indices)
         except FileNotFoundError as e: